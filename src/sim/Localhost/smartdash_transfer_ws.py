@@ -12,28 +12,51 @@ Dieses Script:
 - sendet Log + Packet Messages an das UI
 
 Zusatz:
-- RAW Logging im Terminal (wie TapProxy)
+- RAW Logging im Terminal (wie TapProxy), nur mit DEBUG_RAW = True (oder RAW_LOG=1)
   [SIM→UI] und [UI→SIM] exakt als Textframe
-  [CONNECT] / [CLOSE] / [READY]
+- [CONNECT] / [CLOSE] / [READY]
 """
 
 import asyncio
+import functools
+import heapq
 import json
+import math
+import os
+import queue
 import random
+import socket
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from itertools import accumulate
 
 
 import websockets
 
+try:
+    import orjson
+except ImportError:  # optional: schnellerer JSON-Encoder
+    orjson = None
+
+
 
 # =========================
 # SERVER SETTINGS
 # =========================
 HOST = "0.0.0.0"
 PORT = 8765
-ALLOWED_PATHS = {"/packets", "/"}
+ALLOWED_PATHS = frozenset(("/packets", "/"))
+
+# UI sendet nichts -> eingehende Frames klein halten
+INBOUND_MAX_SIZE = 1024
+
+# permessage-deflate aus: lokales Netz, Kompression kostet nur CPU pro Frame
+WS_COMPRESSION = None
+
+# kleine Frames sofort senden (kein Nagle) + größerer Sendepuffer
+SOCKET_SNDBUF = 256 * 1024
 
 # ==========================================
 # TIMING SETTINGS
@@ -44,39 +67,234 @@ ROUTE_TTL_MS = 9000 # default wenn nicht spezifiziert
 # Demo: alle 2s Paket-Status ändern
 DEMO_COMMAND_EVERY_S = 2.0
 
+# Raster für Sendeintervalle: Routen mit gleichem gerundeten Takt werden zusammen gefeuert
+# (Intervall weicht dadurch um max. SCHEDULE_BUCKET_MS/2 ab)
+SCHEDULE_BUCKET_MS = 100
+
+# Hop-Deadlines auf dieses Raster (aufgerundet) -> Sequenzen verschiedener Routen wachen gemeinsam auf
+HOP_GRID_MS = 5
+
+# max. Nachrichten, die der Writer zu einem Frame (JSON-Array) bündelt
+SEND_BATCH_MAX = 128
+
+# max. wartende Nachrichten pro Verbindung; läuft die Queue voll, ist das UI zu langsam -> trennen
+SEND_QUEUE_MAX = 4096
+
+# Writer wartet nach der ersten Nachricht so lange auf weitere, bevor er sendet (0 = sofort)
+SEND_COALESCE_MS = 10
+
+# Seed für die zufälligen Sendeintervalle der Routen (None = bei jedem Start neu)
+ROUTE_FREQ_SEED = 0xC0FFEE
+
 # =========================
 # RAW LOGGING
 # =========================
+# Jeden Frame im Terminal mitschreiben. Kostet pro Frame Formatierung + I/O -> default aus.
+# Einschalten auch ohne Code-Änderung: RAW_LOG=1
+DEBUG_RAW = os.environ.get("RAW_LOG", "0") == "1"
+
+# max. wartende Log-Zeilen; kommt das Terminal nicht hinterher, werden neue verworfen
+RAW_LOG_MAX = 10000
+
+_raw_q: queue.Queue = queue.Queue(maxsize=RAW_LOG_MAX)
+_raw_thread: threading.Thread | None = None
+# verworfene Zeilen seit der letzten Meldung; Event-Loop zählt hoch, Log-Thread liest + setzt zurück
+_raw_dropped = 0
+_raw_dropped_lock = threading.Lock()
+
+
+# (Millisekunde, formatierter Zeitstempel) – Log-Zeilen im selben Burst teilen sich die ms
+_last_ts: tuple[int, str] = (0, "")
+
+
+def _fmt_ts(t: float) -> str:
+    global _last_ts
+
+    ms = int(t * 1000)
+    if ms != _last_ts[0]:
+        # lokale Uhrzeit per Ganzzahl-Rechnung statt datetime + strftime
+        lt = time.localtime(ms // 1000)
+        text = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}.{ms % 1000:03d}"
+        # Tupel als Ganzes ersetzen: wird auch aus dem Log-Thread aufgerufen
+        _last_ts = (ms, text)
+    return _last_ts[1]
+
+
 def ts() -> str:
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    return _fmt_ts(time.time())
 
 
-def raw_log(direction: str, payload):
+# Richtungs-Präfixe einmal encodiert
+DIR_SIM_UI = "[SIM→UI]".encode()
+
+
+def _raw_line(t: float, direction: bytes, payload) -> bytes:
+    # Frames liegen schon als UTF-8 vor -> direkt als Bytes, ohne decode/encode-Umweg
     if isinstance(payload, bytes):
-        print(f"{ts()} {direction} <binary {len(payload)} bytes>", flush=True)
+        body = payload
+    else:
+        body = str(payload).encode("utf-8", "replace")
+    return b"%s %s %s\n" % (_fmt_ts(t).encode(), direction, body)
+
+
+def _raw_log_drain():
+    """
+    Läuft im eigenen Thread: holt alles, was gerade ansteht,
+    und schreibt es mit EINEM write + flush (statt pro Zeile).
+    """
+    global _raw_dropped
+
+    # Bytes nur dann direkt in den Puffer, wenn stdout ohnehin UTF-8 schreibt (Windows-Konsole/Datei sonst Text)
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if (getattr(out, "encoding", "") or "").lower().replace("-", "") != "utf8":
+        buf = None
+
+    while True:
+        lines = [_raw_line(*_raw_q.get())]
+        while len(lines) < 256:
+            try:
+                lines.append(_raw_line(*_raw_q.get_nowait()))
+            except queue.Empty:
+                break
+
+        with _raw_dropped_lock:
+            dropped, _raw_dropped = _raw_dropped, 0
+        if dropped:
+            lines.append(f"{ts()} [RAW-LOG] {dropped} Zeilen verworfen\n".encode())
+
+        chunk = b"".join(lines)
+        if buf is not None:
+            # Text-Layer zuerst leeren, sonst überholen die Bytes wartende print()-Zeilen
+            out.flush()
+            buf.write(chunk)
+            buf.flush()
+        else:
+            out.write(chunk.decode("utf-8", "replace"))
+            out.flush()
+
+
+def raw_log(direction: bytes, payload):
+    global _raw_thread, _raw_dropped
+
+    if not DEBUG_RAW:
         return
-    print(f"{ts()} {direction} {payload}", flush=True)
 
+    if _raw_thread is None:
+        _raw_thread = threading.Thread(target=_raw_log_drain, name="raw-log", daemon=True)
+        _raw_thread.start()
+
+    # Zeitstempel nur roh merken, formatiert wird im Log-Thread
+    try:
+        _raw_q.put_nowait((time.time(), direction, payload))
+    except queue.Full:
+        # Event-Loop nie am Terminal blockieren (Lock nur im Überlauf, nicht pro Zeile)
+        with _raw_dropped_lock:
+            _raw_dropped += 1
+
+
+async def send_raw(ws, frame: bytes):
+    # genau ein Sender pro Verbindung (ws_writer) -> kein Lock nötig
+    raw_log(DIR_SIM_UI, frame)
+    # JSON liegt schon als UTF-8 vor -> als Textframe senden, ohne str-Umweg
+    await ws.send(frame, text=True)
+
+
+def _encode(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+def queue_frame(ws, frame: bytes):
+    try:
+        ws.sd_send_q.put_nowait(frame)
+    except asyncio.QueueFull:
+        # Writer beenden -> handler räumt die Verbindung ab (einmal pro Verbindung melden)
+        if not getattr(ws, "sd_dropped", False):
+            ws.sd_dropped = True
+            print(f"{ts()} [SLOW] Sendequeue voll, trenne UI peer={getattr(ws, 'remote_address', None)}", flush=True)
+            ws.sd_writer.cancel()
 
-async def send_text(ws, text: str):
-    raw_log("[SIM→UI]", text)
 
-    lock = getattr(ws, "sd_send_lock", None)
-    if lock is None:
-        await ws.send(text)
+def send_obj(ws, obj: dict):
+    # nur einreihen: gesendet wird ausschließlich vom ws_writer der Verbindung
+    queue_frame(ws, _encode(obj))
+
+
+# alle verbundenen UIs (mit laufendem ws_writer).
+# Tupel, bei Connect/Close neu gebunden -> Broadcast iteriert ohne Kopie/Lock
+CLIENTS: tuple = ()
+
+
+def broadcast_frame(frame: bytes):
+    # einmal encodiert, an jede Verbindung verteilt
+    for ws in CLIENTS:
+        queue_frame(ws, frame)
+
+
+def set_cork(ws, on: bool):
+    # Linux: Kernel hält kleine Writes zurück, bis wieder "entkorkt" wird
+    sock = getattr(ws, "sd_sock", None)
+    if sock is None or not hasattr(socket, "TCP_CORK"):
         return
 
-    async with lock:
-        await ws.send(text)
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1 if on else 0)
+    except OSError:
+        pass
 
 
-async def send_obj(ws, obj: dict):
-    msg = json.dumps(obj, ensure_ascii=False)
-    await send_text(ws, msg)
+async def ws_writer(ws, q: asyncio.Queue):
+    """
+    Einziger Sender pro Verbindung.
+    Alles, was seit dem letzten Send aufgelaufen ist, geht als EIN Frame raus.
+    """
+    try:
+        while True:
+            batch = [await q.get()]
+            if SEND_COALESCE_MS > 0:
+                # Hops anderer Routen mit fast gleicher Deadline noch mitnehmen
+                await asyncio.sleep(SEND_COALESCE_MS / 1000)
+            while not q.empty() and len(batch) < SEND_BATCH_MAX:
+                batch.append(q.get_nowait())
+
+            # Frame-Header + Payload (bzw. mehrere Frames) -> ein TCP-Segment
+            set_cork(ws, True)
+            try:
+                if len(batch) == 1:
+                    for frame in batch:
+                        await send_raw(ws, frame)
+                else:
+                    # UI (parseIncoming) versteht JSON-Arrays als Sammel-Frame
+                    await send_raw(ws, b"[" + b",".join(batch) + b"]")
+            finally:
+                set_cork(ws, False)
+    except Exception as e:
+        print(f"{ts()} [WRITER-END] {e!r}", flush=True)
+
+
+# (Sekunde, ISO-String, ISO-Bytes) – Timestamps haben nur Sekundenauflösung
+_last_iso: tuple[int, str, bytes] = (0, "", b"")
+
+
+def _iso_cache() -> tuple[int, str, bytes]:
+    global _last_iso
+
+    sec = int(time.time())
+    if sec != _last_iso[0]:
+        text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        _last_iso = (sec, text, text.encode())
+    return _last_iso
 
 
 def iso_now() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    return _iso_cache()[1]
+
+
+def iso_now_bytes() -> bytes:
+    # für die Byte-Vorlagen (stamp_frame), spart das encode pro Frame
+    return _iso_cache()[2]
 
 
 def make_log(text: str, level: str = "info") -> dict:
@@ -97,7 +315,7 @@ def make_route_status(route_id: int, status: str) -> dict:
 # =========================
 # DATA MODEL
 # =========================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hop:
     src: str
     dst: str
@@ -106,11 +324,16 @@ class Hop:
     ttl_ms: int | None = None
     speed_multiplier: float = 1.0
 
-@dataclass(frozen=True)
+    @property
+    def delay_ms(self) -> int:
+        # Wartezeit nach dem Senden dieses Hops (min. 10ms)
+        return max(10, int(round(self.paket_rate_ms * float(self.speed_multiplier * .5))))
+
+@dataclass(frozen=True, slots=True)
 class StatusStep:
     status: str
 
-@dataclass
+@dataclass(slots=True)
 class RouteRuntime:
     """
     Route = hops + steps + runtime state.
@@ -118,12 +341,33 @@ class RouteRuntime:
     """
     route_id: int
     name: str
-    hops: list[Hop]
-    steps: list[StatusStep]
-    packet_frequency_ms: int
+    hops: tuple[Hop, ...]
+    steps: tuple[StatusStep, ...]
+    packet_frequency_ms: int | None  # None = zufällig, siehe resolve_route_frequencies
     step_index: int = 0
+    # Sekunden ab Sequenzstart, bis zu denen nach Hop i gewartet wird
+    hop_deadlines_s: tuple[float, ...] = field(init=False, repr=False)
+    # vorgefertigte Sequenzen je Step-Index (None = noch nicht gebaut), siehe frame_plan
+    frame_plans: list[tuple[tuple[tuple[bytes, bytes, bytes], float], ...] | None] = field(init=False, repr=False)
+    # Status -> erster Step-Index mit diesem Status
+    _status_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _pid_prefix: bytes = field(init=False, repr=False)
+    # (Step, Index, Anzahl) des aktuellen Status, neu gesetzt nur in set_step_by_status
+    _snapshot: tuple[StatusStep, int, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Tabelle wird nur gelesen -> kompakte, unveränderliche Tupel statt Listen
+        self.hops = tuple(self.hops)
+        self.steps = tuple(self.steps)
+        self._pid_prefix = f"sim-r{self.route_id}-".encode()
+        self.hop_deadlines_s = tuple(ms / 1000 for ms in accumulate(h.delay_ms for h in self.hops))
+        for i, st in enumerate(self.steps):
+            self._status_index.setdefault(st.status, i)
+        # ein Slot pro Step, gefüllt von frame_plan()
+        self.frame_plans = [None] * len(self.steps)
+        self._snapshot = self._build_snapshot()
 
-    def snapshot(self) -> tuple[StatusStep, int, int]:
+    def _build_snapshot(self) -> tuple[StatusStep, int, int]:
         if not self.steps:
             return (StatusStep(status=""), 0, 0)
 
@@ -131,1403 +375,200 @@ class RouteRuntime:
         idx = 0 if total == 1 else (self.step_index % total)
         return (self.steps[idx], idx, total)
 
+    def snapshot(self) -> tuple[StatusStep, int, int]:
+        # pro Tick gelesen, ändert sich nur bei Statuswechsel -> fertiges Tupel
+        return self._snapshot
+
     def set_step_by_status(self, status: str) -> bool:
         s = (status or "").strip()
-        if not s or not self.steps:
+        if not s:
             return False
 
-        for i, st in enumerate(self.steps):
-            if st.status == s:
-                self.step_index = i
-                return True
+        i = self._status_index.get(s)
+        if i is None:
+            return False
 
-        return False
+        self.step_index = i
+        # ganzes Tupel auf einmal ersetzen (ein Thread, ein Event-Loop -> kein Lock)
+        self._snapshot = self._build_snapshot()
+        return True
 
 # =========================
 # ROUTES --- DESIGN ---
 # =========================
-ROUTES: list[RouteRuntime] = [
-        RouteRuntime(
-        route_id=37,
-        name="SwitchBot Fensterkontakt-> Amazon Server",
-        hops=[
-            Hop("switchbot_fensterkontakt", "switchbot_hub", "BLE", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("switchbot_hub", "wifi_hub", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("wifi_hub", "fritzbox", "Ethernet",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-            StatusStep("switchbot.fensterkontakt.alarm"),
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300),
-    ),
-
-    RouteRuntime(
-        route_id=38,
-        name="Amazon Server -> Hama Kamera",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "hama_camera", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("hama.kamera.steuerbefehle"),                   
-            StatusStep("hama.kamera.steuerbefehle"),               
-            StatusStep("hama.kamera.steuerbefehle"),               
-            StatusStep("hama.kamera.steuerbefehle"),               
-            StatusStep("hama.kamera.steuerbefehle"),               
-            StatusStep("hama.kamera.steuerbefehle")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=39,
-        name="Amazon Server -> Jura 8 Kaffeemaschine",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "jura_coffee_machine", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("jura.kaffeemaschine.ein_aus"),                   
-            StatusStep("jura.kaffeemaschine.ein_aus"),               
-            StatusStep("jura.kaffeemaschine.ein_aus"),               
-            StatusStep("jura.kaffeemaschine.ein_aus"),               
-            StatusStep("jura.kaffeemaschine.ein_aus"),               
-            StatusStep("jura.kaffeemaschine.ein_aus")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=40,
-        name="Amazon Server -> Roborock 8 Staubsauger",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "roborock_vacuum", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("roborock.staubsauger.ein_aus"),                   
-            StatusStep("roborock.staubsauger.ein_aus"),               
-            StatusStep("roborock.staubsauger.ein_aus"),               
-            StatusStep("roborock.staubsauger.ein_aus"),               
-            StatusStep("roborock.staubsauger.ein_aus"),               
-            StatusStep("roborock.staubsauger.ein_aus")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=41,
-        name="Vorwerk Server -> Thermomix",
-        hops=[
-            Hop("vorwerk_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "thermomix_m6", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("vorwerk.thermomix.ein_aus"),                   
-            StatusStep("vorwerk.thermomix.ein_aus"),               
-            StatusStep("vorwerk.thermomix.ein_aus"),               
-            StatusStep("vorwerk.thermomix.ein_aus"),               
-            StatusStep("vorwerk.thermomix.ein_aus"),               
-            StatusStep("vorwerk.thermomix.ein_aus")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=42,
-        name="Amazon Server -> TP-Link Funksteckdose",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "tplink_socket", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("tplink.funksteckdose.ein_aus"),                   
-            StatusStep("tplink.funksteckdose.ein_aus"),               
-            StatusStep("tplink.funksteckdose.ein_aus"),               
-            StatusStep("tplink.funksteckdose.ein_aus"),               
-            StatusStep("tplink.funksteckdose.ein_aus"),               
-            StatusStep("tplink.funksteckdose.ein_aus")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=44,
-        name="Amazon Server -> FireTV Sick",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "firetv_stick", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("amazon.firetv.audio_video"),                   
-            StatusStep("amazon.firetv.audio_video"),               
-            StatusStep("amazon.firetv.audio_video"),               
-            StatusStep("amazon.firetv.audio_video"),               
-            StatusStep("amazon.firetv.audio_video"),               
-            StatusStep("amazon.firetv.audio_video")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=45,
-        name="Google Server -> Google Chromecast",
-        hops=[
-            Hop("google_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "chromecast", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("google.chromecast.video_audio"),                   
-            StatusStep("google.chromecast.video_audio"),               
-            StatusStep("google.chromecast.video_audio"),               
-            StatusStep("google.chromecast.video_audio"),               
-            StatusStep("google.chromecast.video_audio"),               
-            StatusStep("google.chromecast.video_audio")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=46,
-        name="Amazon Server -> Amazon Echo Show Smart Display",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "smart_display", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("amazon.echo.audio_video"),                   
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=47,
-        name="Amazon Server -> Levoit Luftreiniger",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "levoit_air_purifier", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("amazon.echo.audio_video"),                   
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video"),               
-            StatusStep("amazon.echo.audio_video")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=48,
-        name="Amazon Server -> Ring Kamera",
-        hops=[
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("fritzbox", "wifi_hub", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("wifi_hub", "ring_camera", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[
-            StatusStep("amazon.kamera.video_audio"),                   
-            StatusStep("amazon.kamera.video_audio"),               
-            StatusStep("amazon.kamera.video_audio"),               
-            StatusStep("amazon.kamera.video_audio"),               
-            StatusStep("amazon.kamera.video_audio"),               
-            StatusStep("amazon.kamera.video_audio")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=51,
-        name="Pixel 7a -> OralB Zahnbürste",
-        hops=[
-            
-            Hop("pixel_7a", "oralb_toothbrush", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("oralb.zahnbürste.steuerbefehl")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=52,
-        name="OralB Zahnbürste -> Pixel 7a",
-        hops=[
-            
-            Hop("oralb_toothbrush", "pixel_7a", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("oralb.zahnbürste.reinigungsroutinen")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=53,
-        name="Pixel 7a -> ABUS Fahrradschloss",
-        hops=[
-            
-            Hop("pixel_7a", "abus_lock", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("abus.fahrradschloss.auf_zu")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=54,
-        name="ABUS Fahrradschloss -> Pixel 7a",
-        hops=[
-            
-            Hop("abus_lock", "pixel_7a", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("abus.fahrradschloss.status")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=55,
-        name="Masterlock Schlüsseltresor -> Pixel 7a",
-        hops=[
-            
-            Hop("masterlock", "pixel_7a", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("masterlock.schlüsseltresor.alarm")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=56,
-        name="Pixel 7a -> Masterlock Schlüsseltresor",
-        hops=[
-            
-            Hop("pixel_7a", "masterlock", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("masterlock.schlüsseltresor.auf_zu")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=57,
-        name="Garmin Smartwatch -> Pixel 7a",
-        hops=[
-            
-            Hop("garmin_watch", "pixel_7a", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("germin.smartwatch.gesundheitsdaten")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=58,
-        name="Pixel 7a -> Garmin Smartwatch",
-        hops=[
-            
-            Hop("pixel_7a", "garmin_watch", "BLE", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("germin.smartwatch.steuerbefehle")                   
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-    
-    RouteRuntime(
-        route_id=59,
-        name="Pixel 7a -> Google Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "google_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.oralbapp.userdaten"),
-            StatusStep("pixel.oralbapp.userdaten"),
-            StatusStep("pixel.oralbapp.userdaten"),
-            StatusStep("pixel.oralbapp.userdaten"),
-            StatusStep("pixel.oralbapp.userdaten")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=60,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.hamaapp.steuerbefehle"),
-            StatusStep("pixel.hamaapp.steuerbefehle"),
-            StatusStep("pixel.hamaapp.steuerbefehle"),
-            StatusStep("pixel.hamaapp.steuerbefehle"),
-            StatusStep("pixel.hamaapp.steuerbefehle")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=71,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.juraapp.ein_aus"),
-            StatusStep("pixel.juraapp.ein_aus"),
-            StatusStep("pixel.juraapp.ein_aus"),
-            StatusStep("pixel.juraapp.ein_aus"),
-            StatusStep("pixel.juraapp.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-    
-    RouteRuntime(
-        route_id=72,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.roborockapp.ein_aus"),
-            StatusStep("pixel.roborockapp.ein_aus"),
-            StatusStep("pixel.roborockapp.ein_aus"),
-            StatusStep("pixel.roborockapp.ein_aus"),
-            StatusStep("pixel.roborockapp.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=73,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.ringapp.steuerbefehle"),
-            StatusStep("pixel.ringapp.steuerbefehle"),
-            StatusStep("pixel.ringapp.steuerbefehle"),
-            StatusStep("pixel.ringapp.steuerbefehle"),
-            StatusStep("pixel.ringapp.steuerbefehle")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=74,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.tplinkapp.ein_aus"),
-            StatusStep("pixel.tplinkapp.ein_aus"),
-            StatusStep("pixel.tplinkapp.ein_aus"),
-            StatusStep("pixel.tplinkapp.ein_aus"),
-            StatusStep("pixel.tplinkapp.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=75,
-        name="Pixel 7a -> Amazon Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "amazon_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.levoitapp.ein_aus"),
-            StatusStep("pixel.levoitapp.ein_aus"),
-            StatusStep("pixel.levoitapp.ein_aus"),
-            StatusStep("pixel.levoitapp.ein_aus"),
-            StatusStep("pixel.levoitapp.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=61,
-        name="Pixel 7a -> Homematic Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "139", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.homematicapp.steuerbefehle"),
-            StatusStep("pixel.homematicapp.steuerbefehle"),
-            StatusStep("pixel.homematicapp.steuerbefehle"),
-            StatusStep("pixel.homematicapp.steuerbefehle"),
-            StatusStep("pixel.homematicapp.steuerbefehle")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=62,
-        name="Pixel 7a -> Bosch Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "bosch_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.boschapp.steuerbefehle"),
-            StatusStep("pixel.boschapp.steuerbefehle"),
-            StatusStep("pixel.boschapp.steuerbefehle"),
-            StatusStep("pixel.boschapp.steuerbefehle"),
-            StatusStep("pixel.boschapp.steuerbefehle")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=63,
-        name="Pixel 7a -> Philips Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "phillips_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.philipsapp.steuerbefehle"),
-            StatusStep("pixel.philipsapp.steuerbefehle"),
-            StatusStep("pixel.philipsapp.steuerbefehle"),
-            StatusStep("pixel.philipsapp.steuerbefehle"),
-            StatusStep("pixel.philipsapp.steuerbefehle")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=64,
-        name="Pixel 7a -> Vorwerk Server",
-        hops=[
-            
-            Hop("pixel_7a", "fritzbox", "WLAN",speed_multiplier=1.0,ttl_ms=65000),
-            Hop("fritzbox", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("internet_provider", "vorwerk_server", "Ethernet", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.thermomix.ein_aus"),
-            StatusStep("pixel.thermomix.ein_aus"),
-            StatusStep("pixel.thermomix.ein_aus"),
-            StatusStep("pixel.thermomix.ein_aus"),
-            StatusStep("pixel.thermomix.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=65,
-        name="Google Server -> Pixel 7a",
-        hops=[
-            
-            Hop("google_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.masterlockapp.standordabfrage"),
-            StatusStep("pixel.masterlockapp.standordabfrage"),
-            StatusStep("pixel.masterlockapp.standordabfrage"),
-            StatusStep("pixel.masterlockapp.standordabfrage"),
-            StatusStep("pixel.masterlockapp.standordabfrage")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=76,
-        name="Google Server -> Pixel 7a",
-        hops=[
-            
-            Hop("google_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.abusapp.standordabfrage"),
-            StatusStep("pixel.abusapp.standordabfrage"),
-            StatusStep("pixel.abusapp.standordabfrage"),
-            StatusStep("pixel.abusapp.standordabfrage"),
-            StatusStep("pixel.abusapp.standordabfrage")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=66,
-        name="Amazon Server -> Pixel 7a",
-        hops=[
-            
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.ringapp.audio_video"),
-            StatusStep("pixel.ringapp.audio_video"),
-            StatusStep("pixel.ringapp.audio_video"),
-            StatusStep("pixel.ringapp.audio_video"),
-            StatusStep("pixel.ringapp.audio_video")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=77,
-        name="Amazon Server -> Pixel 7a",
-        hops=[
-            
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.hamaapp.audio_video"),
-            StatusStep("pixel.hamaapp.audio_video"),
-            StatusStep("pixel.hamaapp.audio_video"),
-            StatusStep("pixel.hamaapp.audio_video"),
-            StatusStep("pixel.hamaapp.audio_video")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=78,
-        name="Amazon Server -> Pixel 7a",
-        hops=[
-            
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.juraapp.status"),
-            StatusStep("pixel.juraapp.status"),
-            StatusStep("pixel.juraapp.status"),
-            StatusStep("pixel.juraapp.status"),
-            StatusStep("pixel.juraapp.status")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=79,
-        name="Amazon Server -> Pixel 7a",
-        hops=[
-            
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.roborockapp.status"),
-            StatusStep("pixel.roborockapp.status"),
-            StatusStep("pixel.roborockapp.status"),
-            StatusStep("pixel.roborockapp.status"),
-            StatusStep("pixel.roborockapp.status")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=80,
-        name="Amazon Server -> Pixel 7a",
-        hops=[
-            
-            Hop("amazon_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.levoitapp.status"),
-            StatusStep("pixel.levoitapp.status"),
-            StatusStep("pixel.levoitapp.status"),
-            StatusStep("pixel.levoitapp.status"),
-            StatusStep("pixel.levoitapp.status")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=67,
-        name="Homematic Server -> Pixel 7a",
-        hops=[
-            
-            Hop("139", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.homematicapp.alarm"),
-            StatusStep("pixel.homematicapp.alarm"),
-            StatusStep("pixel.homematicapp.alarm"),
-            StatusStep("pixel.homematicapp.alarm"),
-            StatusStep("pixel.homematicapp.alarm")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=67,
-        name="Bosch Server -> Pixel 7a",
-        hops=[
-            
-            Hop("bosch_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.boschapp.audio_video"),
-            StatusStep("pixel.boschapp.audio_video"),
-            StatusStep("pixel.boschapp.audio_video"),
-            StatusStep("pixel.boschapp.audio_video"),
-            StatusStep("pixel.boschapp.audio_video")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=81,
-        name="Bosch Server -> Pixel 7a",
-        hops=[
-            
-            Hop("bosch_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.boschapp.alarm"),
-            StatusStep("pixel.boschapp.alarm"),
-            StatusStep("pixel.boschapp.alarm"),
-            StatusStep("pixel.boschapp.alarm"),
-            StatusStep("pixel.boschapp.alarm")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=82,
-        name="Bosch Server -> Pixel 7a",
-        hops=[
-            
-            Hop("bosch_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.boschapp.ein_aus"),
-            StatusStep("pixel.boschapp.ein_aus"),
-            StatusStep("pixel.boschapp.ein_aus"),
-            StatusStep("pixel.boschapp.ein_aus"),
-            StatusStep("pixel.boschapp.ein_aus")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=83,
-        name="Bosch Server -> Pixel 7a",
-        hops=[
-            
-            Hop("bosch_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.boschapp.status"),
-            StatusStep("pixel.boschapp.status"),
-            StatusStep("pixel.boschapp.status"),
-            StatusStep("pixel.boschapp.status"),
-            StatusStep("pixel.boschapp.status")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=69,
-        name="Philips Server -> Pixel 7a",
-        hops=[
-            
-            Hop("phillips_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.philipsapp.alarm"),
-            StatusStep("pixel.philipsapp.alarm"),
-            StatusStep("pixel.philipsapp.alarm"),
-            StatusStep("pixel.philipsapp.alarm"),
-            StatusStep("pixel.philipsapp.alarm")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-
-    RouteRuntime(
-        route_id=70,
-        name="Vorwerk Server -> Pixel 7a",
-        hops=[
-            
-            Hop("vorwerk_server", "internet_provider", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("internet_provider", "pfsense", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("pfsense", "poe_switch", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-            Hop("poe_switch", "fritzbox", "Ethernet", speed_multiplier=1.0, ttl_ms=65000),
-
-            Hop("fritzbox", "pixel_7a", "WLAN", speed_multiplier=1.0, ttl_ms=65000)
-        ],
-        steps=[              
-            StatusStep("pixel.levoitapp.messwerte"),
-            StatusStep("pixel.levoitapp.messwerte"),
-            StatusStep("pixel.levoitapp.messwerte"),
-            StatusStep("pixel.levoitapp.messwerte"),
-            StatusStep("pixel.levoitapp.messwerte")
-        ],
-        packet_frequency_ms=int(random.random() * 6000 + 300)
-    ),
-    ###############################################################################################################
-    RouteRuntime(
-        route_id=5,
-        name="Bosch Fensterkontakt -> Bosch Server",
-        hops=[
-            Hop("499", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.0, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.fensterkontakt.status"),
-            StatusStep("bosch.fensterkontakt.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=6,
-        name="Bosch Funksteckdose -> Bosch Server",
-        hops=[
-            Hop("679", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.funksteckdose.status"),
-            StatusStep("bosch.funksteckdose.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=7,
-        name="Bosch Wassersensor -> Bosch Server",
-        hops=[
-            Hop("54", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.wassersensor.status"),
-            StatusStep("bosch.wassersensor.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=8,
-        name="Bosch Türschloss -> Bosch Server",
-        hops=[
-            Hop("496", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.1, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.türschloss.status"),
-            StatusStep("bosch.türschloss.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=9,
-        name="Bosch Feuermelder -> Bosch Server",
-        hops=[
-            Hop("493", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.3, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.feuermelder.status"),
-            StatusStep("bosch.feuermelder.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=10,
-        name="Bosch Bewegungssensor -> Bosch Server",
-        hops=[
-            Hop("hue_motion", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.3, ttl_ms=17000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bewegungssensor.status"),
-            StatusStep("bosch.bewegungssensor.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=11,
-        name="Bosch Innenkamera -> Bosch Server",
-        hops=[
-            Hop("638", "Bosch Smart Home Controller", "ZigBee", speed_multiplier=1.0, ttl_ms=15000),
-            Hop("Bosch Smart Home Controller", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "bosch_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.innenkamera.status"),
-            StatusStep("bosch.innenkamera.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=12,
-        name="Bosch Server ->Bosch Funksteckdose ",
-        hops=[
-            Hop("bosch_server","5850", "Ethernet", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("5850","pfSense" , "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense","PoE-Switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch","Bosch Smart Home Controller" , "Ethernet", speed_multiplier=1.0),
-            Hop("Bosch Smart Home Controller","638" , "ZigBee", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bosch_server.status"),
-            StatusStep("bosch.bosch_server.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=13,
-        name="Bosch Server ->Bosch Türschloss",
-        hops=[
-            Hop("bosch_server","5850", "Ethernet", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("5850","pfSense" , "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense","PoE-Switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch","Bosch Smart Home Controller" , "Ethernet", speed_multiplier=1.0),
-            Hop("Bosch Smart Home Controller","496" , "ZigBee", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bosch_server.status"),
-            StatusStep("bosch.bosch_server.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=14,
-        name="Bosch Server ->Bosch Feuermelder",
-        hops=[
-            Hop("bosch_server","5850", "Ethernet", speed_multiplier=1.3, ttl_ms=15000),
-            Hop("5850","pfSense" , "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense","PoE-Switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch","Bosch Smart Home Controller" , "Ethernet", speed_multiplier=1.0),
-            Hop("Bosch Smart Home Controller","493", "ZigBee", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bosch_server.status"),
-            StatusStep("bosch.bosch_server.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=15,
-        name="Bosch Server ->Bosch Türschloss",
-        hops=[
-            Hop("bosch_server","5850", "Ethernet", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("5850","pfSense" , "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense","PoE-Switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch","Bosch Smart Home Controller" , "Ethernet", speed_multiplier=1.0),
-            Hop("Bosch Smart Home Controller","638", "ZigBee", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bosch_server.status"),
-            StatusStep("bosch.bosch_server.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=16,
-        name="Philips Hue Bewegungssensor -> Philips Server",
-        hops=[
-            Hop("hue_motion","hue_bridge", "ZigBee", speed_multiplier=1.0, ttl_ms=15000),
-            Hop("hue_bridge","poe_switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "phillips_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.bewegungssensor.status"),
-            StatusStep("bosch.bewegungssensor.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=17,
-        name="Philips Hue Schreibtischlampe -> Philips Server",
-        hops=[
-            Hop("hue_lamp","hue_bridge", "ZigBee", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("hue_bridge","poe_switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "phillips_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.hue_lamp.status"),
-            StatusStep("bosch.hue_lamp.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=18,
-        name="Phillips Server -> Phillips Schreibtischlampe",
-        hops=[
-            Hop("phillips_server", "5850", "Ethernet", speed_multiplier=1.3, ttl_ms=15000),
-            Hop("5850", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("poe_switch", "hue_bridge", "Ethernet", speed_multiplier=1.0),
-            Hop("hue_bridge", "hue_motion", "ZigBee", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.phillips_server.status"),
-            StatusStep("bosch.phillips_server.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=19,
-        name="Homematic Bewegungssensor -> Homematic Server",
-        hops=[
-            Hop("homematic_motion","homematic_controller", "ZigBee", speed_multiplier=1.0, ttl_ms=15000),
-            Hop("homematic_controller","poe_switch" , "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "139", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.homematic_motion.status"),
-            StatusStep("bosch.homematic_motion.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=20,
-        name="Homematic Rauchmelder -> Homematic Server",
-        hops=[
-            Hop("homematic_smoke", "homematic_controller", "ZigBee", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("homematic_controller", "poe_switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "139", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.homematic_smoke.status"),
-            StatusStep("bosch.homematic_smoke.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=21,
-        name="Homematic Funksteckdose -> Homematic Server",
-        hops=[
-            Hop("698", "homematic_controller", "ZigBee", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("homematic_controller", "poe_switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "139", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.homematic_funksteckdose.status"),
-            StatusStep("bosch.homematic_funksteckdose.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=22,
-        name="Hama Kamera -> Amazon Server",
-        hops=[
-            Hop("hama_camera", "wifi_hub", "WLAN", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.hama_camera.status"),
-            StatusStep("bosch.hama_camera.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=23,
-        name="Jura 8 Kaffeemaschine -> Amazon Server",
-        hops=[
-            Hop("jura_coffee_machine", "wifi_hub", "WLAN", speed_multiplier=0.84, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.jura_8_kaffeemaschine.status"),
-            StatusStep("bosch.jura_8_kaffeemaschine.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=24,
-        name="Roborock 8 Staubsauger -> Amazon Server",
-        hops=[
-            Hop("roborock_vacuum", "wifi_hub", "WLAN", speed_multiplier=0.9, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.roborock_vacuum.status"),
-            StatusStep("bosch.roborock_vacuum.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=25,
-        name="Thermomix M6 -> Vorwerk Server",
-        hops=[
-            Hop("thermomix_m6", "wifi_hub", "WLAN", speed_multiplier=1.0, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "vorwerk_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.thermomix_m6.status"),
-            StatusStep("bosch.thermomix_m6.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=26,
-        name="TP-Link Funksteckdose -> Amazon Server",
-        hops=[
-            Hop("tplink_socket", "wifi_hub", "WLAN", speed_multiplier=1.16, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.tplink_socket.status"),
-            StatusStep("bosch.tplink_socket.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=27,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("withings_scale", "wifi_hub", "WLAN", speed_multiplier=1.3, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "google_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.withings_scale.status"),
-            StatusStep("bosch.withings_scale.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=28,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("firetv_stick", "wifi_hub", "WLAN", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.firetv_stick.status"),
-            StatusStep("bosch.firetv_stick.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=29,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("chromecast", "wifi_hub", "WLAN", speed_multiplier=1.3, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "google_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.chromecast.status"),
-            StatusStep("bosch.chromecast.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-        RouteRuntime(
-        route_id=30,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("smart_display", "wifi_hub", "WLAN", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.smart_display.status"),
-            StatusStep("bosch.smart_display.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-    RouteRuntime(
-        route_id=31,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("levoit_air_purifier", "wifi_hub", "WLAN", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.levoit_air_purifier.status"),
-            StatusStep("bosch.levoit_air_purifier.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-    RouteRuntime(
-        route_id=32,
-        name="Witings Körperwaage -> Google Server",
-        hops=[
-            Hop("ring_camera", "wifi_hub", "WLAN", speed_multiplier=1.25, ttl_ms=15000),
-            Hop("wifi_hub", "fritzbox", "Ethernet", speed_multiplier=1.0),
-            Hop("fritzbox", "PoE-Switch", "Ethernet", speed_multiplier=1.0),
-            Hop("PoE-Switch", "pfSense", "Ethernet", speed_multiplier=1.0),
-            Hop("pfSense", "5850", "Ethernet", speed_multiplier=1.0),
-            Hop("5850", "amazon_server", "Ethernet", speed_multiplier=1.0),
-        ],
-        steps=[
-            StatusStep("bosch.ring_camera.status"),
-            StatusStep("bosch.ring_camera.alarm"),
-        ],
-        packet_frequency_ms=9000,
-    ),
-]
+# bekannte Knoten-IDs (= Geräte-IDs im UI), aus ROUTES_FILE
+NODES: set[str] = set()
+
+# gleiche Hops/Steps werden von vielen Routen geteilt -> je eine Instanz
+# (beide frozen -> geteilte Instanzen nie zur Laufzeit ändern)
+_HOP_CACHE: dict[tuple, Hop] = {}
+_STEP_CACHE: dict[str, StatusStep] = {}
+
+def H(src: str, dst: str, protocol: str, *, paket_rate_ms: int = 1600,
+      ttl_ms: int | None = None, speed_multiplier: float = 1.0) -> Hop:
+    key = (src, dst, protocol, paket_rate_ms, ttl_ms, speed_multiplier)
+    hop = _HOP_CACHE.get(key)
+    if hop is None:
+        # IDs müssen exakt den Geräte-IDs im UI entsprechen (einmal pro Hop geprüft)
+        for node in (src, dst):
+            if node not in NODES:
+                raise ValueError(f"unbekannter Knoten {node!r} in Hop {src!r} -> {dst!r}")
+        hop = _HOP_CACHE[key] = Hop(sys.intern(src), sys.intern(dst), sys.intern(protocol),
+                                    paket_rate_ms, ttl_ms, speed_multiplier)
+    return hop
+
+def S(status: str) -> StatusStep:
+    step = _STEP_CACHE.get(status)
+    if step is None:
+        # Status-Namen mit Punkten interniert Python nicht von selbst
+        step = _STEP_CACHE[status] = StatusStep(sys.intern(status))
+    return step
+
+# gleiche Status-Folge -> dasselbe steps-Tupel für alle Routen
+_STEPS_CACHE: dict[tuple[str, ...], tuple[StatusStep, ...]] = {}
+
+def steps_of(statuses: tuple[str, ...]) -> tuple[StatusStep, ...]:
+    steps = _STEPS_CACHE.get(statuses)
+    if steps is None:
+        steps = _STEPS_CACHE[statuses] = tuple(S(status) for status in statuses)
+    return steps
+
+def resolve_route_frequencies(routes: tuple[RouteRuntime, ...]):
+    # zufällige Sendeintervalle (300..6299 ms) erst beim Serverstart würfeln, nicht beim Import
+    rng = random.Random(ROUTE_FREQ_SEED)
+    for r in routes:
+        if r.packet_frequency_ms is None:
+            r.packet_frequency_ms = rng.randrange(300, 6300)
+
+# TTL aller Hops aus EDGES (speed_multiplier bleibt 1.0)
+EDGE_TTL_MS = 65000
+
+# Routen-Tabelle (Knoten, Teilstrecken, Kanten, Routen), liegt neben diesem Script
+ROUTES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "routes.json")
+
+# Verbindungen im Heimnetz: (von, nach) -> Protokoll, aus ROUTES_FILE
+EDGES: dict[tuple[str, str], str] = {}
+
+# benannte Teilstrecken ("@name" in einem Pfad), aus ROUTES_FILE
+SEGMENTS: dict[str, list[str]] = {}
+
+def expand_path(path: list[str]) -> list[str]:
+    # "@downlink" usw. durch die Knoten der Teilstrecke ersetzen
+    nodes: list[str] = []
+    for node in path:
+        if node.startswith("@"):
+            nodes.extend(SEGMENTS[node[1:]])
+        else:
+            nodes.append(node)
+    return nodes
+
+# Pfad -> Hops; gleiche Strecken bekommen dasselbe Tupel
+_PATH_CACHE: dict[tuple[str, ...], tuple[Hop, ...]] = {}
+
+def path_hops(path: list[str]) -> tuple[Hop, ...]:
+    # Hops entlang path aus EDGES
+    key = tuple(path)
+    hops = _PATH_CACHE.get(key)
+    if hops is None:
+        built = []
+        for src, dst in zip(key, key[1:]):
+            built.append(H(src, dst, EDGES[(src, dst)], ttl_ms=EDGE_TTL_MS))
+        hops = _PATH_CACHE[key] = tuple(built)
+    return hops
+
+def _route_from_hops(route_id: int, name: str, hops: tuple[Hop, ...], status: str,
+                     packet_frequency_ms: int | None = None) -> RouteRuntime:
+    # ein Step pro Hop mit gleichem Status
+    return RouteRuntime(
+        route_id=route_id,
+        name=name,
+        hops=hops,
+        steps=steps_of((status,) * len(hops)),
+        packet_frequency_ms=packet_frequency_ms,
+    )
+
+def reverse_route(route: RouteRuntime, route_id: int, name: str, steps: tuple[StatusStep, ...], *,
+                  speed_multiplier: float = 1.0, ttl_ms: int = 15000,
+                  packet_frequency_ms: int | None = None) -> RouteRuntime:
+    # Rückrichtung: gleiche Hops rückwärts, Tempo + TTL nur am ersten Hop (wie bei den Hinrouten)
+    back = [H(h.dst, h.src, h.protocol) for h in reversed(route.hops)]
+    first = back[0]
+    back[0] = H(first.src, first.dst, first.protocol, ttl_ms=ttl_ms, speed_multiplier=speed_multiplier)
+    return RouteRuntime(
+        route_id=route_id,
+        name=name,
+        hops=tuple(back),
+        steps=steps,
+        packet_frequency_ms=packet_frequency_ms,
+    )
+
+def build_route(route_id: int, name: str, path: list[str], status: str,
+                packet_frequency_ms: int | None = None) -> RouteRuntime:
+    return _route_from_hops(route_id, name, path_hops(path), status, packet_frequency_ms)
+
+def _route_from_row(row: dict, by_id: dict[int, RouteRuntime]) -> RouteRuntime:
+    route_id = row["id"]
+    name = row["name"]
+    freq_ms = row.get("freq_ms")
+
+    # "path": Hops aus EDGES (inkl. "@Teilstrecken"), ein Status für alle Steps
+    if "path" in row:
+        return build_route(route_id, name, expand_path(row["path"]), row["status"], freq_ms)
+
+    steps = steps_of(tuple(row["steps"]))
+
+    # "reverse_of": Rückrichtung einer weiter oben definierten Route
+    # (optional "speed_multiplier"/"ttl_ms" für den ersten Hop, sonst Defaults von reverse_route)
+    if "reverse_of" in row:
+        opts = {key: row[key] for key in ("speed_multiplier", "ttl_ms") if key in row}
+        return reverse_route(by_id[row["reverse_of"]], route_id, name, steps,
+                             packet_frequency_ms=freq_ms, **opts)
+
+    # "hops": [src, dst, protocol, {optionale Hop-Felder}]
+    hops = tuple(H(src, dst, protocol, **(opts[0] if opts else {})) for src, dst, protocol, *opts in row["hops"])
+    return RouteRuntime(route_id=route_id, name=name, hops=hops, steps=steps, packet_frequency_ms=freq_ms)
+
+
+# Pflichtfelder je Zeilenart in ROUTES_FILE["routes"]
+_ROW_KEYS = {
+    "path": ("id", "name", "status", "path"),
+    "reverse_of": ("id", "name", "reverse_of", "steps"),
+    "hops": ("id", "name", "hops", "steps"),
+}
+
+
+def _check_table(table: dict):
+    # Tippfehler in routes.json beim Laden melden, nicht erst als KeyError mitten im Bauen
+    for key in ("nodes", "segments", "edges", "routes"):
+        if key not in table:
+            raise ValueError(f"{ROUTES_FILE}: Schlüssel {key!r} fehlt")
+
+    for n, row in enumerate(table["routes"]):
+        kind = next((k for k in _ROW_KEYS if k in row), None)
+        if kind is None:
+            raise ValueError(f"{ROUTES_FILE}: Route #{n} braucht 'path', 'reverse_of' oder 'hops'")
+        missing = [k for k in _ROW_KEYS[kind] if k not in row]
+        if missing:
+            raise ValueError(f"{ROUTES_FILE}: Route {row.get('id', f'#{n}')} ({kind}) ohne {', '.join(missing)}")
+
+
+def _build_routes() -> list[RouteRuntime]:
+    with open(ROUTES_FILE, "rb") as f:
+        raw = f.read()
+    table = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _check_table(table)
+
+    NODES.update(table["nodes"])
+    SEGMENTS.update(table["segments"])
+    EDGES.update(((src, dst), protocol) for src, dst, protocol in table["edges"])
+
+    routes: list[RouteRuntime] = []
+    by_id: dict[int, RouteRuntime] = {}
+    for row in table["routes"]:
+        route = _route_from_row(row, by_id)
+        by_id.setdefault(route.route_id, route)
+        routes.append(route)
+    return routes
 
 
 #Block markieren
@@ -1547,7 +588,8 @@ export const PROTOCOL_ETHERNET: Protocol = 'Ethernet';
 """
 
 
-ROUTE_BY_ID: dict[int, RouteRuntime] = {r.route_id: r for r in ROUTES}
+# wird von get_routes() befüllt
+ROUTE_BY_ID: dict[int, RouteRuntime] = {}
 
 
 # =========================
@@ -1555,14 +597,14 @@ ROUTE_BY_ID: dict[int, RouteRuntime] = {r.route_id: r for r in ROUTES}
 # =========================
 def make_packet(*, hop: Hop, packet_id: str, ttl_ms_to_send: int | None) -> dict:
     packet: dict = {
-        "timestamp": iso_now(),
         "sourceDeviceId": hop.src,
         "targetDeviceId": hop.dst,
         "protocol": hop.protocol,
         "packetRateMs": hop.paket_rate_ms,
         "speedMultiplier": float(hop.speed_multiplier),
-        "packetId": packet_id,
         "messageType": "transfer_ws_server",
+        "timestamp": iso_now(),
+        "packetId": packet_id,
     }
 
     if ttl_ms_to_send is not None:
@@ -1581,100 +623,282 @@ def make_packet_with_route(
     step_total: int,
 ) -> dict:
     msg = make_packet(hop=hop, packet_id=packet_id, ttl_ms_to_send=ttl_ms_to_send)
-    packet = msg.get("packet")
+    # make_packet baut das Paket frisch -> payload direkt anhängen
+    msg["packet"]["payload"] = {
+        "routeId": int(route.route_id),
+        "routeName": route.name,
+        "status": str(step.status),
+        "statusIndex": int(step_index),
+        "statusTotal": int(step_total),
+    }
+    return msg
 
-    if not isinstance(packet, dict):
-        return msg
 
-    payload = packet.get("payload")
-    if not isinstance(payload, dict):
-        payload = {}
-        packet["payload"] = payload
+# Platzhalter in den vorgefertigten Frames, werden pro Paket ersetzt
+_TS_SENTINEL = "__TS__"
+_PID_SENTINEL = "__PID__"
+_TS_KEY = b'"__TS__"'
 
-    payload["routeId"] = int(route.route_id)
-    payload["routeName"] = route.name
-    payload["status"] = str(step.status)
-    payload["statusIndex"] = int(step_index)
-    payload["statusTotal"] = int(step_total)
 
-    return msg
+def hop_ttl(hop: Hop, hop_index: int) -> int | None:
+    if hop.ttl_ms is not None:
+        return hop.ttl_ms
+    if hop_index == 0:
+        return ROUTE_TTL_MS
+    return None
 
-async def send_one_packet_sequence(ws, route: RouteRuntime, packet_id: str, step: StatusStep, idx: int, total: int):
-    ttl_for_first_hop = ROUTE_TTL_MS
 
-    for i, hop in enumerate(route.hops):
-        if hop.ttl_ms is not None:
-            ttl_to_send = hop.ttl_ms
-        elif i == 0:
-            ttl_to_send = ttl_for_first_hop
-        else:
-            ttl_to_send = None
+# Paket-JSON ohne Timestamp/PacketId: (bis Timestamp, bis PacketId, Rest)
+FrameTemplate = tuple[bytes, bytes, bytes]
+
+
+def split_template(frame: bytes) -> FrameTemplate:
+    # Timestamp steht im Paket vor der PacketId (Reihenfolge aus make_packet)
+    head, _, rest = frame.partition(_TS_SENTINEL.encode())
+    mid, _, tail = rest.partition(_PID_SENTINEL.encode())
+    return (head, mid, tail)
 
-        await send_obj(
-            ws,
-            make_packet_with_route(
+
+# (route_id, Step-Index) -> statische Paket-Dicts je Hop (ohne Timestamp/PacketId)
+_PACKET_TEMPLATES: dict[tuple[int, int], tuple[dict, ...]] = {}
+
+
+def packet_templates(route: RouteRuntime, step: StatusStep, idx: int, total: int) -> tuple[dict, ...]:
+    """
+    Alles, was sich innerhalb einer Sequenz nie ändert, einmal je (Route, Step).
+    Timestamp + PacketId bleiben Platzhalter an ihrer festen Position im Dict.
+    """
+    key = (route.route_id, idx)
+    templates = _PACKET_TEMPLATES.get(key)
+    if templates is None:
+        built = []
+        for i, hop in enumerate(route.hops):
+            msg = make_packet_with_route(
                 hop=hop,
-                packet_id=packet_id,
-                ttl_ms_to_send=ttl_to_send,
+                packet_id=_PID_SENTINEL,
+                ttl_ms_to_send=hop_ttl(hop, i),
                 route=route,
                 step=step,
                 step_index=idx,
                 step_total=total,
-            ),
-        )
-        effective_ms = int(round(hop.paket_rate_ms * float(hop.speed_multiplier * .5)))
-        await asyncio.sleep(max(10, effective_ms) / 1000)
+            )
+            msg["packet"]["timestamp"] = _TS_SENTINEL
+            built.append(msg["packet"])
+        templates = _PACKET_TEMPLATES[key] = tuple(built)
+    return templates
 
-MAX_INFLIGHT_PER_ROUTE = 1  # Schutz: nicht unendlich viele parallele Pakete
 
-async def loop_route_sender(ws, route: RouteRuntime):
-    if not route.hops:
-        await send_obj(ws, make_log(f"Route {route.route_id} hat keine Hops – keine Packets.", "warn"))
-        return
+def stamp_packet(template: dict, timestamp: str, packet_id: str) -> dict:
+    # flache Kopie reicht: payload wird nie verändert
+    return {"type": "packet", "packet": {**template, "timestamp": timestamp, "packetId": packet_id}}
+
+
+def build_frame_plan(route: RouteRuntime, idx: int) -> tuple[tuple[FrameTemplate, float], ...]:
+    """
+    Kompletter Ablauf einer Sequenz für Step idx: (fertiges JSON, Deadline) je Hop.
+    Im JSON bleiben nur Timestamp + PacketId offen (JSON an den Lücken zerteilt).
+    """
+    templates = packet_templates(route, route.steps[idx], idx, len(route.steps))
+    return tuple(
+        (split_template(_encode(stamp_packet(template, _TS_SENTINEL, _PID_SENTINEL))), deadline)
+        for template, deadline in zip(templates, route.hop_deadlines_s, strict=True)
+    )
+
+
+def frame_plan(route: RouteRuntime, idx: int) -> tuple[tuple[FrameTemplate, float], ...]:
+    # erst bei Bedarf bauen: bei gleichen Steps ist nur der erste Index erreichbar
+    plan = route.frame_plans[idx]
+    if plan is None:
+        plan = route.frame_plans[idx] = build_frame_plan(route, idx)
+    return plan
+
+
+def stamp_frame(template: FrameTemplate, timestamp: bytes, packet_id: bytes) -> bytes:
+    # nur zusammensetzen, kein Suchen im Frame (beide Werte sind ASCII, kein Escaping nötig)
+    head, mid, tail = template
+    return b"".join((head, timestamp, mid, packet_id, tail))
+
+
+# (route_id, status) -> fertiger routeStatus-Frame, Timestamp als Platzhalter
+_ROUTE_STATUS_FRAMES: dict[tuple[int, str], bytes] = {}
+
+
+def _route_status_template(route_id: int, status: str) -> bytes:
+    key = (int(route_id), str(status))
+    template = _ROUTE_STATUS_FRAMES.get(key)
+    if template is None:
+        msg = make_route_status(route_id, status)
+        msg["timestamp"] = _TS_SENTINEL
+        template = _ROUTE_STATUS_FRAMES[key] = _encode(msg)
+    return template
+
+
+def route_status_frame(route_id: int, status: str) -> bytes:
+    template = _route_status_template(route_id, status)
+    return template.replace(_TS_KEY, b'"' + iso_now_bytes() + b'"', 1)
+
+
+@functools.cache
+def get_routes() -> tuple[RouteRuntime, ...]:
+    # Routen + Frame-Vorlagen erst beim ersten Zugriff bauen, nicht beim Import
+    routes = tuple(_build_routes())
+    flows: dict = {}
+    for r in routes:
+        # doppelte IDs würden sich im UI (und in RouteControl) gegenseitig überschreiben
+        other = ROUTE_BY_ID.setdefault(r.route_id, r)
+        if other is not r:
+            raise ValueError(f"route_id {r.route_id} doppelt: {other.name!r} / {r.name!r}")
+        # gleicher Pfad + gleiche Status = derselbe Fluss, nur doppelt im Scheduler
+        flow = (tuple((h.src, h.dst) for h in r.hops), r.steps)
+        other = flows.setdefault(flow, r)
+        if other is not r:
+            raise ValueError(f"Route {r.route_id} ({r.name!r}) doppelt zu Route {other.route_id} ({other.name!r})")
+
+    for r in routes:
+        # set_step_by_status springt immer auf den ersten Index eines Status
+        for idx in r._status_index.values():
+            frame_plan(r, idx)
+        for status in r._status_index:
+            _route_status_template(r.route_id, status)
+
+    return routes
+
+
+def grid_up(t: float) -> float:
+    # Deadline aufs HOP_GRID_MS-Raster aufrunden: Hops im selben Slot gehen in einem Wakeup raus
+    grid = HOP_GRID_MS / 1000
+    return math.ceil(t / grid) * grid if grid > 0 else t
+
+
+def sequence_plan(route: RouteRuntime, step: StatusStep, idx: int, total: int) -> tuple[tuple, ...]:
+    # (Vorlage, Deadline ab Sequenzstart) je Hop
+    if route.steps:
+        return frame_plan(route, idx)
+
+    # ohne Steps gibt's keinen Frame-Plan -> Paket-Dicts, pro Hop encoden
+    return tuple(zip(packet_templates(route, step, idx, total), route.hop_deadlines_s, strict=True))
+
+
+def hop_frame(template, packet_id: bytes) -> bytes:
+    # Paket-Dict (ohne Steps) oder zerteilte JSON-Vorlage
+    if isinstance(template, dict):
+        return _encode(stamp_packet(template, iso_now(), packet_id.decode()))
+    return stamp_frame(template, iso_now_bytes(), packet_id)
+
+
+def schedule_period_ms(route: RouteRuntime) -> int:
+    # Intervall aufs Bucket-Raster runden -> Routen mit ähnlichem Takt teilen sich einen Heap-Eintrag
+    freq_ms = max(10, int(route.packet_frequency_ms))
+    return max(SCHEDULE_BUCKET_MS, round(freq_ms / SCHEDULE_BUCKET_MS) * SCHEDULE_BUCKET_MS)
+
+
+async def route_scheduler(ws, routes: tuple[RouteRuntime, ...]):
+    """
+    Alle Routen einer Verbindung in EINEM Task, ohne Task pro Paket.
+    Zwei Min-Heaps: Takt-Buckets (neue Sequenzen) und fällige Hops laufender Sequenzen.
+    Pro Wakeup gehen alle fälligen Hops + Sequenzstarts raus.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    buckets: dict[int, list[int]] = {}
+    for n, route in enumerate(routes):
+        if not route.hops:
+            send_obj(ws, make_log(f"Route {route.route_id} hat keine Hops – keine Packets.", "warn"))
+            continue
+        send_obj(ws, make_log(f"Starte Route-Sender {route.route_id}.", "success"))
+        buckets.setdefault(schedule_period_ms(route), []).append(n)
+
+    # (fällig, Takt in s, Routen-Indizes im Bucket)
+    events: list[tuple[float, float, tuple[int, ...]]] = [
+        (start, period_ms / 1000, tuple(members)) for period_ms, members in buckets.items()
+    ]
+    heapq.heapify(events)
 
-    await send_obj(ws, make_log(f"Starte Route-Sender {route.route_id}.", "success"))
+    # Hop-Frames direkt in die Writer-Queue, ohne Umweg über send_obj
+    put = functools.partial(queue_frame, ws)
 
-    inflight: set[asyncio.Task] = set()
-    seq = 0
+    # (fällig, lfd. Nr., Hop-Index, Sequenzstart, packet_id, Plan) – lfd. Nr. hält den Heap stabil
+    hops: list[tuple[float, int, int, float, bytes, tuple]] = []
+    order = 0
+
+    # max. EIN Paket pro Route unterwegs: Route frei ab dieser Zeit (Ende der letzten Sequenz)
+    free_at = [start] * len(routes)
+    seqs = [0] * len(routes)
 
     try:
-        while True:
-            # fertige Tasks aufräumen + Exceptions sichtbar machen
-            done = {t for t in inflight if t.done()}
-            for t in done:
-                inflight.remove(t)
-                try:
-                    t.result()
-                except Exception as e:
-                    print(f"{ts()} [ROUTE-TASK r{route.route_id}] {e!r}", flush=True)
-
-            # neues Paket starten 
-            if len(inflight) < MAX_INFLIGHT_PER_ROUTE:
-                seq += 1
-                packet_id = f"sim-r{route.route_id}-{int(time.time()*1000)}-{seq}"
-
-                step, idx, total = route.snapshot()
-                task = asyncio.create_task(send_one_packet_sequence(ws, route, packet_id, step, idx, total))
-                inflight.add(task)
-
-            freq_ms = max(10, int(route.packet_frequency_ms))
-            await asyncio.sleep(freq_ms / 1000)
+        while events or hops:
+            due = events[0][0]
+            if hops and hops[0][0] < due:
+                due = hops[0][0]
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # alles Fällige in einem Durchgang, ohne Zwischen-Yield -> selber Writer-Batch
+            now = loop.time()
+            # Zeitanteil der PacketIds: einmal pro Wakeup statt pro Route
+            # (monotonic: keine Sprünge bei Uhrzeit-Korrektur, kein Float-Umweg)
+            now_ms = time.monotonic_ns() // 1_000_000
+            while hops and hops[0][0] <= now:
+                _, _, i, t0, packet_id, plan = heapq.heappop(hops)
+                put(hop_frame(plan[i][0], packet_id))
+                if i + 1 < len(plan):
+                    order += 1
+                    heapq.heappush(hops, (grid_up(t0 + plan[i][1]), order, i + 1, t0, packet_id, plan))
+
+            while events and events[0][0] <= now:
+                due, period, members = heapq.heappop(events)
+
+                for n in members:
+                    if free_at[n] > now:
+                        continue
+                    route = routes[n]
+
+                    # neues Paket starten
+                    seqs[n] += 1
+                    # direkt als Bytes für stamp_frame
+                    packet_id = b"%s%d-%d" % (route._pid_prefix, now_ms, seqs[n])
+
+                    step, idx, total = route.snapshot()
+                    plan = sequence_plan(route, step, idx, total)
+                    # feste Deadlines ab Start statt Sleep pro Hop -> kein Drift über die Hops
+                    free_at[n] = grid_up(now + plan[-1][1])
+
+                    # erster Hop sofort, Rest über den Hop-Heap
+                    put(hop_frame(plan[0][0], packet_id))
+                    if len(plan) > 1:
+                        order += 1
+                        heapq.heappush(hops, (grid_up(now + plan[0][1]), order, 1, now, packet_id, plan))
+
+                # verpasste Termine überspringen statt sie nachzuholen (kein Burst nach Hängern)
+                next_due = due + period
+                if next_due <= now:
+                    next_due = due + period * ((now - due) // period + 1)
+                heapq.heappush(events, (next_due, period, members))
 
     except Exception as e:
-        print(f"{ts()} [ROUTE-END r{route.route_id}] {e!r}", flush=True)
+        print(f"{ts()} [ROUTE-END] {e!r}", flush=True)
 
 # =========================
 # ROUTE CONTROLBEREICH --- Status umschalten ---
 # =========================
 class RouteControl:
     def __init__(self, route_by_id: dict[int, RouteRuntime]):
-        self.routes = route_by_id
+        # route_ids sind kleine Ganzzahlen -> Liste mit route_id als Index statt Dict
+        self.routes: list[RouteRuntime | None] = [None] * (max(route_by_id, default=-1) + 1)
+        for route_id, route in route_by_id.items():
+            self.routes[route_id] = route
 
     def _get(self, route_id: int) -> RouteRuntime | None:
-        try:
-            return self.routes.get(int(route_id))
-        except Exception:
-            return None
+        if type(route_id) is not int:
+            try:
+                route_id = int(route_id)
+            except (TypeError, ValueError):
+                return None
+        if 0 <= route_id < len(self.routes):
+            return self.routes[route_id]
+        return None
 
     def set_status(self, route_id: int, status: str) -> bool:
         r = self._get(route_id)
@@ -1682,79 +906,88 @@ class RouteControl:
             return False
         return r.set_step_by_status(status)
 
-async def demo_control_loop(rc: RouteControl, ws):
+# Demo: Route -> Status-Folge, zyklisch je DEMO_COMMAND_EVERY_S
+DEMO_SCHEDULE: list[tuple[int, list[str]]] = [
+    # Route 1 (nur 1 Status)
+    (1, ["bosch.funksteckdose.status"]),
+    # Route 2-4 normal / Alarm
+    (2, ["bosch.wassersensor.status", "bosch.wassersensor.alarm"]),
+    (3, ["bosch.wassersensor.status", "bosch.wassersensor.alarm"]),
+    (4, ["bosch.wassersensor.status", "bosch.wassersensor.alarm"]),
+]
+
+
+async def demo_control_loop(rc: RouteControl):
     """
-    Demo: Statuswechsel laufen parallel.
-    Jede Route hat ihren eigenen Loop und schaltet unabhängig um.
+    Demo: Statuswechsel aller Routen in EINEM Task, geteilt von allen UIs.
+    Alle Einträge haben denselben Takt -> pro Runde ein Wakeup, Status = Runde % Länge.
     """
+    schedule: list[tuple[int, list[str]]] = []
+    for route_id, statuses in DEMO_SCHEDULE:
+        if rc._get(route_id) is None:
+            print(f"{ts()} [DEMO] Route {route_id} existiert nicht – übersprungen", flush=True)
+            continue
+        schedule.append((route_id, statuses))
+    if not schedule:
+        return
 
-    async def set_and_wait(route_id: int, status: str):
-        ok = rc.set_status(route_id, status)
-        if ok:
-            await send_obj(ws, make_route_status(route_id, status))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    rnd = 0
 
-        await asyncio.sleep(DEMO_COMMAND_EVERY_S)
+    while True:
+        for route_id, statuses in schedule:
+            status = statuses[rnd % len(statuses)]
+            if rc.set_status(route_id, status):
+                broadcast_frame(route_status_frame(route_id, status))
 
-    async def loop_route_1():
-        while True:
-            # Route 1 (nur 1 Status)
-            await set_and_wait(1, "bosch.funksteckdose.status")
+        rnd += 1
+        await asyncio.sleep(max(0.0, start + rnd * DEMO_COMMAND_EVERY_S - loop.time()))
 
-    async def loop_route_2():
-        while True:
-            # Route 2 normal
-            await set_and_wait(2, "bosch.wassersensor.status")
-            # Route 2 Alarm
-            await set_and_wait(2, "bosch.wassersensor.alarm")
-
-    async def loop_route_3():
-        while True:
-            # Route 3 normal
-            await set_and_wait(3, "bosch.wassersensor.status")
-            # Route 3 Alarm
-            await set_and_wait(3, "bosch.wassersensor.alarm")
 
-    async def loop_route_4():
-        while True:
-            # Route 4 normal
-            await set_and_wait(4, "bosch.wassersensor.status")
-            # Route 4 Alarm
-            await set_and_wait(4, "bosch.wassersensor.alarm")
-
-    tasks = [
-        asyncio.create_task(loop_route_1()),
-        asyncio.create_task(loop_route_2()),
-        asyncio.create_task(loop_route_3()),
-        asyncio.create_task(loop_route_4()),
-    ]
-
-    try:
-        await asyncio.gather(*tasks)
-    except asyncio.CancelledError:
-        for t in tasks:
-            t.cancel()
-        return
+FUN_LOG_LINES = [
+    "Sim schaut kurz in den Briefkasten. 📬",
+    "Sim winkt der Kamera zu. 👋",
+    "Sim prüft, ob WLAN da ist. 📶",
+    "Sim läuft zur Haustür und klingelt. 🔔",
+    "Sim wartet – niemand öffnet. 🕒",
+    "Sim läuft zurück zur Zentrale. 🏠",
+]
 
+# fertig encodiert, ändern sich nie
+_FUN_LOG_FRAMES = [_encode(make_log(line, "info")) for line in FUN_LOG_LINES]
+_fun_log_choice = random.Random().choice
 
-async def loop_fun_logs(ws):
-    lines = [
-        "Sim schaut kurz in den Briefkasten. 📬",
-        "Sim winkt der Kamera zu. 👋",
-        "Sim prüft, ob WLAN da ist. 📶",
-        "Sim läuft zur Haustür und klingelt. 🔔",
-        "Sim wartet – niemand öffnet. 🕒",
-        "Sim läuft zurück zur Zentrale. 🏠",
-    ]
 
+async def loop_fun_logs():
     try:
         while True:
-            await send_obj(ws, make_log(random.choice(lines), "info"))
+            broadcast_frame(_fun_log_choice(_FUN_LOG_FRAMES))
             await asyncio.sleep(SEND_LOG_EVERY_MS / 1000)
     except Exception as e:
         print(f"{ts()} [LOG-END] {e!r}", flush=True)
 
 
+def tune_socket(ws):
+    transport = getattr(ws, "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF)
+    except OSError as e:
+        print(f"{ts()} [SOCKET] tuning fehlgeschlagen: {e!r}", flush=True)
+        return
+
+    # für set_cork im ws_writer
+    ws.sd_sock = sock
+
+
 async def handler(ws):
+    global CLIENTS
+
     path = getattr(ws, "path", "/")
     peer = getattr(ws, "remote_address", None)
 
@@ -1765,23 +998,31 @@ async def handler(ws):
         print(f"{ts()} [CLOSE] rejected path={path}", flush=True)
         return
 
-    await send_obj(ws, make_log(f"✅ UI verbunden auf {path}.", "success"))
+    tune_socket(ws)
+
+    ws.sd_send_q = asyncio.Queue(maxsize=SEND_QUEUE_MAX)
+    writer_task = ws.sd_writer = asyncio.create_task(ws_writer(ws, ws.sd_send_q))
 
-    ws.sd_send_lock = asyncio.Lock()
+    send_obj(ws, make_log(f"✅ UI verbunden auf {path}.", "success"))
 
     # Config: erstes hop travel als baseline
-    first_hop_ms = ROUTES[0].hops[0].paket_rate_ms if ROUTES and ROUTES[0].hops else 120
-    await send_obj(ws, make_config(first_hop_ms))
+    routes = get_routes()
+    first_hop_ms = routes[0].hops[0].paket_rate_ms if routes and routes[0].hops else 120
+    send_obj(ws, make_config(first_hop_ms))
 
-    rc = RouteControl(ROUTE_BY_ID)
+    route_tasks = [asyncio.create_task(route_scheduler(ws, routes))]
+    CLIENTS += (ws,)
 
-    demo_task = asyncio.create_task(demo_control_loop(rc, ws))
-    route_tasks = [asyncio.create_task(loop_route_sender(ws, r)) for r in ROUTES]
+    # Eingehendes wird nicht gelesen; Ping/Pong + Close erledigt websockets selbst
+    closed_task = asyncio.create_task(ws.wait_closed())
 
     try:
-        await asyncio.gather(loop_fun_logs(ws), *route_tasks)
+        # Ende bei Disconnect oder wenn der Writer aussteigt
+        await asyncio.wait({writer_task, closed_task}, return_when=asyncio.FIRST_COMPLETED)
     finally:
-        demo_task.cancel()
+        CLIENTS = tuple(c for c in CLIENTS if c is not ws)
+        writer_task.cancel()
+        closed_task.cancel()
         for t in route_tasks:
             t.cancel()
         print(f"{ts()} [CLOSE] UI disconnected, peer={peer}", flush=True)
@@ -1790,12 +1031,34 @@ async def handler(ws):
 async def main():
     print(f"🟢 WebSocket SERVER läuft auf ws://{HOST}:{PORT}/packets", flush=True)
     print(f"{ts()} [READY] waiting for UI connections...", flush=True)
-    async with websockets.serve(handler, HOST, PORT):
-        await asyncio.Future()
+
+    resolve_route_frequencies(get_routes())
+
+    # Demo-Status + Fun-Logs laufen einmal für alle UIs
+    rc = RouteControl(ROUTE_BY_ID)
+    shared_tasks = [
+        asyncio.create_task(demo_control_loop(rc)),
+        asyncio.create_task(loop_fun_logs()),
+    ]
+
+    try:
+        async with websockets.serve(handler, HOST, PORT, max_size=INBOUND_MAX_SIZE, compression=WS_COMPRESSION):
+            await asyncio.Future()
+    finally:
+        for t in shared_tasks:
+            t.cancel()
 
 
 if __name__ == "__main__":
+    run = asyncio.run
+    try:
+        import uvloop  # optional: schnellerer Event-Loop (nicht unter Windows)
+        # uvloop.run statt uvloop.install(): kommt ohne Event-Loop-Policy aus (ab Python 3.14 deprecated)
+        run = getattr(uvloop, "run", asyncio.run)
+    except ImportError:
+        pass
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n🛑 Server gestoppt.", flush=True)